@@ -3,11 +3,19 @@ Main collector that orchestrates all scrapers and saves to database
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict
-from database import init_database, save_case, update_progress, get_statistics
+from database import (
+    init_database,
+    save_case,
+    save_cases_bulk,
+    update_progress,
+    get_statistics,
+)
 from mass_gov_scraper import MassGovAppellateScraper, MassGovTrialScraper
 from courtlistener_scraper import CourtListenerScraper
+from scraper_base import Scraper
 import config
 
 logger = logging.getLogger(__name__)
@@ -18,7 +26,7 @@ class CaseCollector:
 
     def __init__(self):
         self.db_client = init_database()
-        self.scrapers = [
+        self.scrapers: List[Scraper] = [
             CourtListenerScraper(),  # Primary source - CourtListener
             # MassGovAppellateScraper(),  # Disabled for now
             # MassGovTrialScraper(),  # Disabled for now
@@ -28,6 +36,13 @@ class CaseCollector:
         """Save a single case to the database"""
         return save_case(case_data)
 
+    def save_cases(self, cases: List[Dict]) -> int:
+        """Save cases in batches of config.DB_BATCH_LIMIT, returning how many were new"""
+        saved_count = 0
+        for i in range(0, len(cases), config.DB_BATCH_LIMIT):
+            saved_count += save_cases_bulk(cases[i : i + config.DB_BATCH_LIMIT])
+        return saved_count
+
     def update_progress(
         self,
         source: str,
@@ -38,6 +53,80 @@ class CaseCollector:
         """Update collection progress for a source"""
         update_progress(source, last_date, total_cases, status)
 
+    def _collect_from(
+        self,
+        scraper: Scraper,
+        start_date: datetime,
+        end_date: datetime,
+        max_pages: int = None,
+    ) -> List[Dict]:
+        """Run one scraper, closing it on the same thread that used it"""
+        try:
+            logger.info(f"Collecting from {scraper.source_name}")
+            kwargs = {"start_date": start_date, "end_date": end_date}
+            # Pass max_pages if scraper supports it
+            if scraper.supports_max_pages:
+                kwargs["max_pages"] = max_pages
+            return scraper.collect_cases(**kwargs)
+        finally:
+            # Save session state and clean up Playwright; the sync Playwright
+            # API must be torn down from the thread that started it
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.debug(f"Error closing {scraper.source_name}: {e}")
+
+    def _save_collected(
+        self, scraper: Scraper, cases: List[Dict], end_date: datetime
+    ) -> int:
+        """Save one scraper's cases and record its progress"""
+        saved_count = self.save_cases(cases)
+        self.update_progress(
+            scraper.source_name,
+            last_date=end_date,
+            total_cases=saved_count,
+            status="completed" if saved_count > 0 else "error",
+        )
+        logger.info(f"Saved {saved_count} new cases from {scraper.source_name}")
+        return saved_count
+
+    def _record_failure(self, scraper: Scraper, error: Exception):
+        logger.error(f"Error collecting from {scraper.source_name}: {error}")
+        self.update_progress(scraper.source_name, status="error")
+
+    def _collect_parallel(
+        self, start_date: datetime, end_date: datetime, max_pages: int = None
+    ) -> int:
+        """Run scrapers side by side, saving on this thread as each finishes"""
+        total_cases = 0
+        # Scrapers are independent (the shared rate limiter is thread-safe).
+        # No `with` block: its exit waits for every crawl, which would hold
+        # Ctrl-C until all scrapers finish.
+        executor = ThreadPoolExecutor(max_workers=len(self.scrapers))
+        futures = {
+            executor.submit(
+                self._collect_from, scraper, start_date, end_date, max_pages
+            ): scraper
+            for scraper in self.scrapers
+        }
+        try:
+            for future in as_completed(futures):
+                scraper = futures[future]
+                try:
+                    total_cases += self._save_collected(
+                        scraper, future.result(), end_date
+                    )
+                except Exception as e:
+                    self._record_failure(scraper, e)
+        except KeyboardInterrupt:
+            # Running scrapers stop at their next page; queued ones never start
+            for scraper in self.scrapers:
+                scraper.stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        return total_cases
+
     def collect_all(
         self,
         start_year: int = config.START_YEAR,
@@ -50,54 +139,17 @@ class CaseCollector:
 
         logger.info(f"Starting collection for years {start_year}-{end_year}")
 
-        total_cases = 0
-
-        for scraper in self.scrapers:
-            try:
-                logger.info(f"Collecting from {scraper.source_name}")
-                # Pass max_pages if scraper supports it
-                if hasattr(scraper, "collect_cases"):
-                    if "max_pages" in scraper.collect_cases.__code__.co_varnames:
-                        cases = scraper.collect_cases(
-                            start_date=start_date,
-                            end_date=end_date,
-                            max_pages=max_pages,
-                        )
-                    else:
-                        cases = scraper.collect_cases(
-                            start_date=start_date, end_date=end_date
-                        )
-                else:
-                    cases = []
-
-                saved_count = 0
-                for case in cases:
-                    if self.save_case(case):
-                        saved_count += 1
-
-                total_cases += saved_count
-                self.update_progress(
-                    scraper.source_name,
-                    last_date=end_date,
-                    total_cases=saved_count,
-                    status="completed" if saved_count > 0 else "error",
-                )
-
-                logger.info(f"Saved {saved_count} new cases from {scraper.source_name}")
-
-            except Exception as e:
-                logger.error(f"Error collecting from {scraper.source_name}: {e}")
-                self.update_progress(scraper.source_name, status="error")
-                continue
-            finally:
-                # Clean up Playwright browser after each scraper
-                if hasattr(scraper, "use_playwright") and scraper.use_playwright:
-                    try:
-                        scraper._close_playwright()
-                    except Exception as e:
-                        logger.debug(
-                            f"Error closing Playwright for {scraper.source_name}: {e}"
-                        )
+        if len(self.scrapers) > 1:
+            total_cases = self._collect_parallel(start_date, end_date, max_pages)
+        else:
+            # Nothing to overlap; run inline so Ctrl-C stops the crawl at once
+            total_cases = 0
+            for scraper in self.scrapers:
+                try:
+                    cases = self._collect_from(scraper, start_date, end_date, max_pages)
+                    total_cases += self._save_collected(scraper, cases, end_date)
+                except Exception as e:
+                    self._record_failure(scraper, e)
 
         logger.info(f"Collection complete. Total new cases saved: {total_cases}")
         return total_cases
@@ -15,11 +15,15 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 CASES_DIR = os.path.join(DATA_DIR, "cases")
 METADATA_DIR = os.path.join(DATA_DIR, "metadata")
 DATABASE_PATH = os.path.join(DATA_DIR, "ma_court_cases.db")
+SESSION_CACHE_DIR = os.path.join(DATA_DIR, "session_cache")
+PAGE_CACHE_DIR = os.path.join(DATA_DIR, "page_cache")
 
 # Create directories if they don't exist
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(CASES_DIR, exist_ok=True)
 os.makedirs(METADATA_DIR, exist_ok=True)
+os.makedirs(SESSION_CACHE_DIR, exist_ok=True)
+os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
 
 # Date range
 START_YEAR = 1900
@@ -47,12 +51,17 @@ DATA_SOURCES = {
 }
 
 # Scraping settings
-REQUEST_DELAY = 1.0  # seconds between requests
+REQUEST_DELAY = 1.0  # average seconds between requests to the same host
+REQUEST_BURST = 3  # requests allowed back-to-back before REQUEST_DELAY applies
+HTTP_POOL_CONNECTIONS = 16  # distinct hosts each session keeps a connection pool for
+HTTP_POOL_MAXSIZE = 4  # keep-alive connections pooled per host in each session
 MAX_RETRIES = 3
 TIMEOUT = 30
+PAGE_CACHE_TTL = 6 * 60 * 60  # seconds to reuse HTML fetched with cache=True; 0 disables
 
 # Database settings
 DB_ECHO = False
+DB_BATCH_LIMIT = 100  # cases per bulk upsert
 
 # Supabase configuration
 # These must be set via environment variables or .env file
@@ -7,8 +7,6 @@ from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 import logging
 from scraper_base import BaseScraper
-import config
-import time
 
 logger = logging.getLogger(__name__)
 
@@ -304,6 +302,9 @@ class CourtListenerScraper(BaseScraper):
         consecutive_empty_pages = 0
 
         while current_url:
+            if self.stop_event.is_set():
+                logger.info("Stop requested, ending pagination")
+                break
             try:
                 logger.info(f"Fetching page {page_num}: {current_url}")
 
@@ -327,6 +328,8 @@ class CourtListenerScraper(BaseScraper):
 
                 # Fetch detailed information for each case
                 for case in page_cases:
+                    if self.stop_event.is_set():
+                        break
                     try:
                         # Fetch individual case page for full details
                         logger.info(f"Fetching details for: {case.get('case_name')} - {case.get('opinion_url')}")
@@ -378,9 +381,6 @@ class CourtListenerScraper(BaseScraper):
                             logger.error(f"Failed to add case even with basic info: {e2}")
                         continue
 
-                    # Small delay between case fetches to be respectful
-                    time.sleep(config.REQUEST_DELAY)
-
                 # Check for next page
                 next_url = self.get_next_page_url(soup, current_url)
                 if not next_url:
@@ -391,12 +391,10 @@ class CourtListenerScraper(BaseScraper):
                     logger.info(f"Reached max pages limit ({max_pages}), stopping")
                     break
 
+                # fetch_page paces requests, so no extra delay between pages
                 current_url = next_url
                 page_num += 1
 
-                # Delay between pages
-                time.sleep(config.REQUEST_DELAY)
-
             except Exception as e:
                 logger.error(f"Error processing page {page_num}: {e}")
                 break
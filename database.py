@@ -3,7 +3,7 @@ Database models and utilities for storing court case data in Supabase
 """
 
 from supabase import create_client, Client
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Dict, Optional
 import logging
 import config
@@ -13,6 +13,19 @@ logger = logging.getLogger(__name__)
 # Initialize Supabase client
 _supabase: Optional[Client] = None
 
+# Set once the bulk upsert fails for lack of the unique index, so later batches
+# go straight to per-case saves instead of repeating a request bound to fail
+_bulk_upsert_unsupported = False
+
+# Every court_cases column except opinion_text, which can be tens of KB per row.
+# Pass as ``columns`` to the getters below when the full text isn't needed.
+CASE_SUMMARY_COLUMNS = (
+    "id, case_name, docket_number, citation, court_type, court_name, "
+    "decision_date, published_date, opinion_url, opinion_file_path, judges, "
+    "case_type, topics, source, source_url, is_published, is_downloaded, "
+    "created_at, updated_at"
+)
+
 
 def get_supabase_client() -> Client:
     """Get or create Supabase client"""
@@ -41,9 +54,34 @@ def init_database():
         return get_supabase_client()
 
 
+def _parse_iso_date(value: str) -> date:
+    """Parse the leading YYYY-MM-DD of an ISO date or timestamp string"""
+    # Slicing skips time/timezone handling we'd discard anyway
+    return date.fromisoformat(value[:10])
+
+
 class CourtCase:
     """Model for storing court case information"""
 
+    # Columns to_dict copies as-is; the date columns are serialized separately
+    _PLAIN_FIELDS = (
+        "case_name",
+        "docket_number",
+        "citation",
+        "court_type",
+        "court_name",
+        "opinion_text",
+        "opinion_url",
+        "opinion_file_path",
+        "judges",
+        "case_type",
+        "topics",
+        "source",
+        "source_url",
+        "is_published",
+        "is_downloaded",
+    )
+
     def __init__(self, **kwargs):
         self.id = kwargs.get("id")
         self.case_name = kwargs.get("case_name", "")
@@ -67,43 +105,27 @@ class CourtCase:
         self.updated_at = kwargs.get("updated_at")
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary for Supabase insertion"""
-        data = {
-            "case_name": self.case_name,
-            "docket_number": self.docket_number,
-            "citation": self.citation,
-            "court_type": self.court_type,
-            "court_name": self.court_name,
-            "decision_date": (
-                self.decision_date.isoformat() if self.decision_date else None
-            ),
-            "published_date": (
-                self.published_date.isoformat() if self.published_date else None
-            ),
-            "opinion_text": self.opinion_text,
-            "opinion_url": self.opinion_url,
-            "opinion_file_path": self.opinion_file_path,
-            "judges": self.judges,
-            "case_type": self.case_type,
-            "topics": self.topics,
-            "source": self.source,
-            "source_url": self.source_url,
-            "is_published": self.is_published,
-            "is_downloaded": self.is_downloaded,
-        }
-        # Remove None values
-        return {k: v for k, v in data.items() if v is not None}
+        """Convert to dictionary for Supabase insertion, omitting None values"""
+        # Build only the keys we keep instead of filtering a full dict afterwards
+        data = {}
+        for field in self._PLAIN_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        if self.decision_date:
+            data["decision_date"] = self.decision_date.isoformat()
+        if self.published_date:
+            data["published_date"] = self.published_date.isoformat()
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict) -> "CourtCase":
         """Create CourtCase from dictionary"""
         # Convert date strings to date objects if needed
         if isinstance(data.get("decision_date"), str):
-            data["decision_date"] = datetime.fromisoformat(data["decision_date"]).date()
+            data["decision_date"] = _parse_iso_date(data["decision_date"])
         if isinstance(data.get("published_date"), str):
-            data["published_date"] = datetime.fromisoformat(
-                data["published_date"]
-            ).date()
+            data["published_date"] = _parse_iso_date(data["published_date"])
         return cls(**data)
 
 
@@ -141,6 +163,20 @@ def get_session():
 
 
 # Database operation functions
+def _prepare_case_row(case_data: Dict) -> Dict:
+    """Build the court_cases row for a scraped case"""
+    insert_data = CourtCase(**case_data).to_dict()
+
+    # Ensure decision_date is set - use a default if missing
+    if not insert_data.get("decision_date"):
+        # Use today's date as default if no date found
+        insert_data["decision_date"] = date.today().isoformat()
+        logger.debug(
+            f"Case {case_data.get('case_name')} has no date, using today as default"
+        )
+    return insert_data
+
+
 def save_case(case_data: Dict) -> bool:
     """Save a case to Supabase"""
     try:
@@ -167,19 +203,7 @@ def save_case(case_data: Dict) -> bool:
                 logger.debug(f"Case already exists: {case_data.get('case_name')}")
                 return False
 
-        # Prepare data for insertion
-        case = CourtCase(**case_data)
-        insert_data = case.to_dict()
-
-        # Ensure decision_date is set - use a default if missing
-        if not insert_data.get("decision_date"):
-            # Use today's date as default if no date found
-            from datetime import date
-
-            insert_data["decision_date"] = date.today().isoformat()
-            logger.debug(
-                f"Case {case_data.get('case_name')} has no date, using today as default"
-            )
+        insert_data = _prepare_case_row(case_data)
 
         # Insert into Supabase
         result = client.table("court_cases").insert(insert_data).execute()
@@ -196,11 +220,67 @@ def save_case(case_data: Dict) -> bool:
         return False
 
 
-def get_case_by_id(case_id: int) -> Optional[Dict]:
-    """Get a case by ID"""
+def save_cases_bulk(cases: List[Dict]) -> int:
+    """Save a batch of cases with a single upsert, returning how many were new
+
+    Cases already stored (same docket_number and decision_date) are skipped
+    by the database. Falls back to per-case save_case if the upsert fails,
+    e.g. when the unique index from supabase_setup.sql hasn't been created.
+    """
+    global _bulk_upsert_unsupported
+    if not cases:
+        return 0
+    if _bulk_upsert_unsupported:
+        return sum(1 for case_data in cases if save_case(case_data))
+
+    rows = []
+    seen = set()
+    for case_data in cases:
+        row = _prepare_case_row(case_data)
+        key = (row.get("docket_number"), row["decision_date"])
+        if key[0] and key in seen:
+            continue
+        seen.add(key)
+        rows.append(row)
+
+    # PostgREST bulk writes need every row to carry the same keys
+    columns = {column for row in rows for column in row}
+    rows = [{column: row.get(column) for column in columns} for row in rows]
+
     try:
         client = get_supabase_client()
-        result = client.table("court_cases").select("*").eq("id", case_id).execute()
+        result = (
+            client.table("court_cases")
+            .upsert(
+                rows,
+                on_conflict="docket_number,decision_date",
+                ignore_duplicates=True,
+            )
+            .execute()
+        )
+        saved_count = len(result.data or [])
+        logger.info(f"Saved {saved_count} of {len(cases)} cases in bulk")
+        return saved_count
+    except Exception as e:
+        # 42P10: no unique index matches the ON CONFLICT columns
+        if getattr(e, "code", None) == "42P10" or "ON CONFLICT" in str(e):
+            _bulk_upsert_unsupported = True
+            logger.warning(
+                "idx_docket_decision_unique is missing; saving cases one at a "
+                "time for the rest of this run (see SUPABASE_SETUP.md)"
+            )
+        else:
+            logger.warning(f"Bulk save failed, falling back to per-case saves: {e}")
+        return sum(1 for case_data in cases if save_case(case_data))
+
+
+def get_case_by_id(case_id: int, columns: str = "*") -> Optional[Dict]:
+    """Get a case by ID, selecting only ``columns``"""
+    try:
+        client = get_supabase_client()
+        result = (
+            client.table("court_cases").select(columns).eq("id", case_id).execute()
+        )
         if result.data:
             return result.data[0]
         return None
@@ -209,13 +289,15 @@ def get_case_by_id(case_id: int) -> Optional[Dict]:
         return None
 
 
-def get_cases_by_court(court_type: str, limit: int = 100) -> List[Dict]:
-    """Get cases by court type"""
+def get_cases_by_court(
+    court_type: str, limit: int = 100, columns: str = "*"
+) -> List[Dict]:
+    """Get cases by court type, selecting only ``columns``"""
     try:
         client = get_supabase_client()
         result = (
             client.table("court_cases")
-            .select("*")
+            .select(columns)
             .eq("court_type", court_type)
             .limit(limit)
             .execute()
@@ -236,15 +318,6 @@ def update_progress(
     try:
         client = get_supabase_client()
 
-        # Check if progress record exists
-        existing = (
-            client.table("collection_progress")
-            .select("id")
-            .eq("source", source)
-            .limit(1)
-            .execute()
-        )
-
         progress_data = {
             "source": source,
             "last_collected_date": (
@@ -255,17 +328,12 @@ def update_progress(
             # Don't include updated_at - it's handled by the database trigger
         }
 
-        if existing.data:
-            # Update existing - don't include updated_at
-            result = (
-                client.table("collection_progress")
-                .update(progress_data)
-                .eq("source", source)
-                .execute()
-            )
-        else:
-            # Insert new
-            result = client.table("collection_progress").insert(progress_data).execute()
+        # source is UNIQUE, so one upsert replaces the exists-check + update/insert
+        result = (
+            client.table("collection_progress")
+            .upsert(progress_data, on_conflict="source")
+            .execute()
+        )
 
         return result.data is not None
     except Exception as e:
@@ -2,16 +2,118 @@
 Scraper for Mass.gov opinion portals using Playwright
 """
 
+import functools
 import re
 from datetime import datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 from scraper_base import BaseScraper
 import config
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; these run against every link, row and list item on a page
+_CASE_HREF_RE = re.compile(r"opinion|case|docket|decision", re.I)
+_DATE_RE = re.compile(r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})")
+
+# Build only the elements extract_cases reads (with their subtrees), skipping
+# head/script/style and page chrome
+_APPELLATE_STRAINER = SoupStrainer(["a", "tr", "li"])
+_TRIAL_STRAINER = SoupStrainer("a")
+
+# Navigation/header link text that never names a case
+_SKIP_KEYWORDS = (
+    "home",
+    "about",
+    "contact",
+    "search",
+    "menu",
+    "skip",
+    "navigation",
+    "massachusetts court cases",
+    "published court opinions",
+    "office of the reporter",
+    "find the newest",
+    "opinion revisions",
+    "sign up",
+    "follow us",
+    "twitter",
+    "email",
+    "notification",
+    "official website",
+    "secure website",
+    "state organizations",
+    "show the sub topics",
+    "health & social",
+    "families & children",
+    "housing & property",
+    "transportation",
+    "living",
+    "topics",
+)
+_TRIAL_SKIP_KEYWORDS = ("home", "about", "contact", "search", "menu", "skip")
+# Text that suggests a link names a case ("v.", "vs.", docket numbers, ...)
+_CASE_INDICATORS = ("v.", "vs.", "v ", "case", "docket", "no.", "number")
+
+
+def _keyword_re(keywords) -> re.Pattern:
+    """Compile keywords into one case-insensitive substring alternation"""
+    return re.compile("|".join(re.escape(k) for k in keywords), re.I)
+
+
+# One C-level scan per link instead of a Python-level `in` test per keyword
+_SKIP_RE = _keyword_re(_SKIP_KEYWORDS)
+_TRIAL_SKIP_RE = _keyword_re(_TRIAL_SKIP_KEYWORDS)
+_CASE_INDICATOR_RE = _keyword_re(_CASE_INDICATORS)
+
+
+# Most common Mass.gov format first so the usual case parses on the first try
+_DATE_FORMATS = ("%m/%d/%Y", "%m-%d-%Y", "%m/%d/%y", "%m-%d-%y", "%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a listing date; cached since one release date repeats across rows"""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+# Substrings that mark an href as pointing at an opinion when the text doesn't
+_URL_INDICATORS = ("opinion", "case", "docket", "decision", ".pdf")
+_LIST_ITEM_INDICATORS = ("v.", "vs.", "case", "opinion")
+
+# Trial court keyword -> court_type, checked in order; anything else is SUPERIOR
+_COURT_KEYWORDS = (
+    ("district", "DISTRICT"),
+    ("probate", "PROBATE"),
+    ("housing", "HOUSING"),
+    ("juvenile", "JUVENILE"),
+)
+
+_MASS_GOV_ORIGIN = "https://www.mass.gov"
+
+
+def _normalize_url(href: str, base_url_slash: str) -> str:
+    """Resolve a listing href against mass.gov or the portal base URL"""
+    if href.startswith("http"):
+        return href
+    if href.startswith("/"):
+        return _MASS_GOV_ORIGIN + href
+    return base_url_slash + href
+
+
+def _add_if_new(case_info: Dict, seen: set, cases: List[Dict]):
+    """Append case_info unless its (case_name, opinion_url) key is missing or seen"""
+    key = (case_info.get("case_name"), case_info.get("opinion_url"))
+    if key[0] and key[1] and key not in seen:
+        seen.add(key)
+        cases.append(case_info)
+
 
 class MassGovAppellateScraper(BaseScraper):
     """Scraper for Mass.gov Appellate Opinion Portal"""
@@ -22,74 +124,48 @@ class MassGovAppellateScraper(BaseScraper):
             config.DATA_SOURCES["MASS_GOV_APPELLATE"],
             use_playwright=True,
         )
+        self._base_url_slash = self.base_url.rstrip("/") + "/"
 
     def extract_cases(self, soup: BeautifulSoup) -> List[Dict]:
         """Extract cases from the opinion portal page"""
+        # Deduplicate on (case_name, opinion_url) as matches come in
+        seen = set()
         cases = []
+        match_count = 0
+
+        # Walk the tree once, dispatching each candidate element by tag:
+        # case links, table rows and list items
+        parsers = {
+            "a": self._parse_case_link,
+            "tr": self._parse_table_row,
+            "li": self._parse_list_item,
+        }
+        tag_counts = dict.fromkeys(parsers, 0)
 
-        # Look for various patterns that might indicate case listings
-        # Try multiple selectors to find case information
-
-        # Look for links with opinion/case/docket keywords
-        case_links = soup.find_all(
-            "a", href=re.compile(r"opinion|case|docket|decision", re.I)
-        )
-
-        # Also look for table rows or list items that might contain case info
-        tables = soup.find_all("table")
-        lists = soup.find_all(["ul", "ol"])
-
-        logger.info(
-            f"Found {len(case_links)} links, {len(tables)} tables, {len(lists)} lists"
-        )
-
-        # Process links
-        for link in case_links:
+        for element in soup.find_all(list(parsers)):
+            name = element.name
+            # Only links whose href mentions opinion/case/docket/decision
+            if name == "a" and not _CASE_HREF_RE.search(element.get("href") or ""):
+                continue
+            tag_counts[name] += 1
             try:
-                case_info = self._parse_case_link(link)
+                case_info = parsers[name](element)
                 if case_info:
-                    cases.append(case_info)
+                    match_count += 1
+                    _add_if_new(case_info, seen, cases)
             except Exception as e:
-                logger.debug(f"Error parsing case link: {e}")
+                logger.debug(f"Error parsing <{name}> element: {e}")
                 continue
 
-        # Process table rows
-        for table in tables:
-            rows = table.find_all("tr")
-            for row in rows:
-                try:
-                    case_info = self._parse_table_row(row)
-                    if case_info:
-                        cases.append(case_info)
-                except Exception as e:
-                    logger.debug(f"Error parsing table row: {e}")
-                    continue
-
-        # Process list items
-        for lst in lists:
-            items = lst.find_all("li")
-            for item in items:
-                try:
-                    case_info = self._parse_list_item(item)
-                    if case_info:
-                        cases.append(case_info)
-                except Exception as e:
-                    logger.debug(f"Error parsing list item: {e}")
-                    continue
-
-        # Remove duplicates based on case name and URL
-        seen = set()
-        unique_cases = []
-        for case in cases:
-            key = (case.get("case_name"), case.get("opinion_url"))
-            if key not in seen and key[0] and key[1]:
-                seen.add(key)
-                unique_cases.append(case)
+        logger.info(
+            f"Found {tag_counts['a']} links, {tag_counts['tr']} table rows, "
+            f"{tag_counts['li']} list items"
+        )
 
         logger.info(
-            f"Extracted {len(unique_cases)} unique cases from {len(cases)} total matches"
+            f"Extracted {len(cases)} unique cases from {match_count} total matches"
         )
-        return unique_cases
+        return cases
 
     def _parse_case_link(self, link) -> Optional[Dict]:
         """Parse a single case link to extract information"""
@@ -100,68 +176,29 @@ class MassGovAppellateScraper(BaseScraper):
         if not text or len(text) < 5:
             return None
 
-        # Skip navigation/header links - expanded list
-        skip_keywords = [
-            "home",
-            "about",
-            "contact",
-            "search",
-            "menu",
-            "skip",
-            "navigation",
-            "massachusetts court cases",
-            "published court opinions",
-            "office of the reporter",
-            "find the newest",
-            "opinion revisions",
-            "sign up",
-            "follow us",
-            "twitter",
-            "email",
-            "notification",
-            "official website",
-            "secure website",
-            "state organizations",
-            "show the sub topics",
-            "health & social",
-            "families & children",
-            "housing & property",
-            "transportation",
-            "living",
-            "topics",
-        ]
-        text_lower = text.lower()
-        if any(skip in text_lower for skip in skip_keywords):
+        # Skip navigation/header links
+        if _SKIP_RE.search(text):
             return None
 
+        href_lower = href.lower()
+
         # Must look like a case - should have "v." or "vs." or be a case number pattern
-        if not any(
-            indicator in text_lower
-            for indicator in ["v.", "vs.", "v ", "case", "docket", "no.", "number"]
-        ):
+        if not _CASE_INDICATOR_RE.search(text):
             # Check if URL suggests it's a case
-            if not any(
-                case_indicator in href.lower()
-                for case_indicator in ["opinion", "case", "docket", "decision", ".pdf"]
-            ):
+            if not any(indicator in href_lower for indicator in _URL_INDICATORS):
                 return None
 
         # Try to extract date from text or nearby elements
-        date_match = re.search(r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", text)
+        date_match = _DATE_RE.search(text)
         date_str = date_match.group(1) if date_match else None
 
         # Try to determine court type from URL or text
         court_type = "APPEALS"
-        if "sjc" in href.lower() or "supreme" in text.lower():
+        if "sjc" in href_lower or "supreme" in text.lower():
             court_type = "SJC"
 
         # Build full URL
-        if href.startswith("http"):
-            full_url = href
-        elif href.startswith("/"):
-            full_url = f"https://www.mass.gov{href}"
-        else:
-            full_url = f"{self.base_url}/{href.lstrip('/')}"
+        full_url = _normalize_url(href, self._base_url_slash)
 
         return {
             "case_name": text[:500],  # Limit length
@@ -188,7 +225,7 @@ class MassGovAppellateScraper(BaseScraper):
             return None
 
         # Try to find date
-        date_match = re.search(r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", text)
+        date_match = _DATE_RE.search(text)
         date_str = date_match.group(1) if date_match else None
 
         # Get the first link
@@ -200,12 +237,7 @@ class MassGovAppellateScraper(BaseScraper):
         if "sjc" in href.lower() or "supreme" in text.lower():
             court_type = "SJC"
 
-        if href.startswith("http"):
-            full_url = href
-        elif href.startswith("/"):
-            full_url = f"https://www.mass.gov{href}"
-        else:
-            full_url = f"{self.base_url}/{href.lstrip('/')}"
+        full_url = _normalize_url(href, self._base_url_slash)
 
         return {
             "case_name": link_text[:500] if link_text else text[:500],
@@ -231,24 +263,18 @@ class MassGovAppellateScraper(BaseScraper):
         link_text = link.get_text(strip=True)
 
         # Skip if doesn't look like a case
-        if not any(
-            keyword in text.lower() for keyword in ["v.", "vs.", "case", "opinion"]
-        ):
+        text_lower = text.lower()
+        if not any(keyword in text_lower for keyword in _LIST_ITEM_INDICATORS):
             return None
 
-        date_match = re.search(r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", text)
+        date_match = _DATE_RE.search(text)
         date_str = date_match.group(1) if date_match else None
 
         court_type = "APPEALS"
-        if "sjc" in href.lower() or "supreme" in text.lower():
+        if "sjc" in href.lower() or "supreme" in text_lower:
             court_type = "SJC"
 
-        if href.startswith("http"):
-            full_url = href
-        elif href.startswith("/"):
-            full_url = f"https://www.mass.gov{href}"
-        else:
-            full_url = f"{self.base_url}/{href.lstrip('/')}"
+        full_url = _normalize_url(href, self._base_url_slash)
 
         return {
             "case_name": link_text[:500] if link_text else text[:500],
@@ -261,16 +287,7 @@ class MassGovAppellateScraper(BaseScraper):
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string to datetime object"""
-        if not date_str:
-            return None
-
-        formats = ["%m/%d/%Y", "%m-%d-%Y", "%m/%d/%y", "%m-%d-%y", "%Y-%m-%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except:
-                continue
-        return None
+        return _parse_date(date_str) if date_str else None
 
     def collect_cases(
         self,
@@ -280,23 +297,13 @@ class MassGovAppellateScraper(BaseScraper):
         """Collect cases from the appellate portal"""
         logger.info(f"Collecting cases from {self.source_name}")
 
-        # Wait for content to load - try common selectors
-        wait_selectors = [
-            "table",
-            "ul",
-            ".opinion",
-            ".case",
-            "[data-opinion]",
-            "main",
-            "article",
-        ]
-
-        response = self.fetch_page(self.base_url, wait_for="main")
+        # The listing changes at most daily, so reruns can reuse today's render
+        response = self.fetch_page(self.base_url, wait_for="main", cache=True)
         if not response:
             logger.error(f"Failed to fetch {self.base_url}")
             return []
 
-        soup = self.parse_html(response.text)
+        soup = self.parse_html(response.text, _APPELLATE_STRAINER)
         cases = self.extract_cases(soup)
 
         # Filter by date if provided
@@ -316,44 +323,33 @@ class MassGovTrialScraper(BaseScraper):
             config.DATA_SOURCES["MASS_GOV_TRIAL"],
             use_playwright=True,
         )
+        self._base_url_slash = self.base_url.rstrip("/") + "/"
 
     def extract_cases(self, soup: BeautifulSoup) -> List[Dict]:
         """Extract trial court cases"""
+        seen = set()
         cases = []
+        match_count = 0
 
-        # Similar approach to appellate scraper
-        case_links = soup.find_all(
-            "a", href=re.compile(r"opinion|case|docket|decision", re.I)
-        )
-        tables = soup.find_all("table")
-        lists = soup.find_all(["ul", "ol"])
+        # Only case links are parsed here, so skip walking tables and lists
+        case_links = soup.find_all("a", href=_CASE_HREF_RE)
 
-        logger.info(
-            f"Found {len(case_links)} links, {len(tables)} tables, {len(lists)} lists"
-        )
+        logger.info(f"Found {len(case_links)} links")
 
         for link in case_links:
             try:
                 case_info = self._parse_trial_case_link(link)
                 if case_info:
-                    cases.append(case_info)
+                    match_count += 1
+                    _add_if_new(case_info, seen, cases)
             except Exception as e:
                 logger.debug(f"Error parsing trial case link: {e}")
                 continue
 
-        # Remove duplicates
-        seen = set()
-        unique_cases = []
-        for case in cases:
-            key = (case.get("case_name"), case.get("opinion_url"))
-            if key not in seen and key[0] and key[1]:
-                seen.add(key)
-                unique_cases.append(case)
-
         logger.info(
-            f"Extracted {len(unique_cases)} unique cases from {len(cases)} total matches"
+            f"Extracted {len(cases)} unique cases from {match_count} total matches"
         )
-        return unique_cases
+        return cases
 
     def _parse_trial_case_link(self, link) -> Optional[Dict]:
         """Parse a trial court case link"""
@@ -364,31 +360,21 @@ class MassGovTrialScraper(BaseScraper):
             return None
 
         # Skip navigation links
-        if any(
-            skip in text.lower()
-            for skip in ["home", "about", "contact", "search", "menu", "skip"]
-        ):
+        if _TRIAL_SKIP_RE.search(text):
             return None
 
         # Determine court type from text or URL
+        href_lower = href.lower()
+        text_lower = text.lower()
         court_type = "SUPERIOR"
-        if "district" in href.lower() or "district" in text.lower():
-            court_type = "DISTRICT"
-        elif "probate" in href.lower() or "probate" in text.lower():
-            court_type = "PROBATE"
-        elif "housing" in href.lower() or "housing" in text.lower():
-            court_type = "HOUSING"
-        elif "juvenile" in href.lower() or "juvenile" in text.lower():
-            court_type = "JUVENILE"
-
-        if href.startswith("http"):
-            full_url = href
-        elif href.startswith("/"):
-            full_url = f"https://www.mass.gov{href}"
-        else:
-            full_url = f"{self.base_url}/{href.lstrip('/')}"
-
-        date_match = re.search(r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", text)
+        for keyword, court in _COURT_KEYWORDS:
+            if keyword in href_lower or keyword in text_lower:
+                court_type = court
+                break
+
+        full_url = _normalize_url(href, self._base_url_slash)
+
+        date_match = _DATE_RE.search(text)
         date_str = date_match.group(1) if date_match else None
 
         return {
@@ -402,16 +388,7 @@ class MassGovTrialScraper(BaseScraper):
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string to datetime object"""
-        if not date_str:
-            return None
-
-        formats = ["%m/%d/%Y", "%m-%d-%Y", "%m/%d/%y", "%m-%d-%y", "%Y-%m-%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except:
-                continue
-        return None
+        return _parse_date(date_str) if date_str else None
 
     def collect_cases(
         self,
@@ -421,12 +398,13 @@ class MassGovTrialScraper(BaseScraper):
         """Collect trial court cases"""
         logger.info(f"Collecting cases from {self.source_name}")
 
-        response = self.fetch_page(self.base_url, wait_for="main")
+        # The listing changes at most daily, so reruns can reuse today's render
+        response = self.fetch_page(self.base_url, wait_for="main", cache=True)
         if not response:
             logger.error(f"Failed to fetch {self.base_url}")
             return []
 
-        soup = self.parse_html(response.text)
+        soup = self.parse_html(response.text, _TRIAL_STRAINER)
         cases = self.extract_cases(soup)
 
         if start_date or end_date:
@@ -2,20 +2,138 @@
 Base scraper class for court case collection
 """
 
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import random
+import tempfile
+import threading
+from dataclasses import dataclass
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import logging
-from datetime import datetime
-from typing import List, Dict, Optional
+import re
+from datetime import date, datetime
+from typing import TYPE_CHECKING, List, Dict, Optional, Protocol, Tuple
+from urllib.parse import urlparse
 import config
 
+# Playwright stays out of module import; scrapers that never launch a browser
+# don't pay for it
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page, Playwright
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_ymd_date(date_str: str) -> date:
+    """Parse a strict YYYY-MM-DD string; cached since listings repeat the same dates
+
+    Unlike database._parse_iso_date, timestamps are rejected with ValueError.
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before a retry, capped at 60
+
+    Honors a numeric Retry-After from the server, otherwise uses jittered
+    exponential backoff so retries don't all land at the same moment.
+    """
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = None  # HTTP-date form; fall back to backoff
+        # Negative or nan/inf values would make time.sleep raise
+        if delay is not None and math.isfinite(delay):
+            return min(max(0.0, delay), 60.0)
+    return min(2**attempt + random.uniform(0, 1), 60.0)
+
+
+def _write_atomic(path: str, content: str):
+    """Write content to path via a temp file, so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class RateLimiter:
+    """Token bucket per host: allows short bursts, then one request per interval"""
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = burst
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # host -> (tokens, time)
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str):
+        """Block until a request to host is allowed"""
+        if self.interval <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) / self.interval)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) * self.interval
+            time.sleep(wait)
+
+
+# Shared by all scrapers so two scrapers hitting the same site share its budget.
+# fetch_page is the only network path and takes a token on both its Playwright
+# and requests branches, so there is no second pacing budget per host.
+_rate_limiter = RateLimiter(config.REQUEST_DELAY, burst=config.REQUEST_BURST)
+
+
+@dataclass
+class MockResponse:
+    """Minimal stand-in for requests.Response wrapping Playwright-rendered HTML"""
+
+    text: str
+    url: str = ""
+    status_code: int = 200
+
+    def raise_for_status(self):
+        pass
+
+
+class Scraper(Protocol):
+    """Interface CaseCollector expects from a scraper"""
+
+    source_name: str
+    use_playwright: bool
+    supports_max_pages: bool
+    stop_event: threading.Event
+
+    def collect_cases(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> List[Dict]: ...
+
+    def close(self): ...
+
+
 class BaseScraper:
     """Base class for all court case scrapers"""
 
@@ -24,13 +142,139 @@ class BaseScraper:
         self.base_url = base_url
         self.use_playwright = use_playwright
         self.session = requests.Session()
+        # Keep-alive pool per host; retries are handled in fetch_page
+        adapter = HTTPAdapter(
+            pool_connections=config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=config.HTTP_POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
             }
         )
-        self.playwright_browser = None
-        self.playwright_page = None
+        self.playwright: Optional["Playwright"] = None
+        self.playwright_browser: Optional["Browser"] = None
+        self.playwright_context: Optional["BrowserContext"] = None
+        self.playwright_page: Optional["Page"] = None
+        # Cookies / browser storage persisted between runs, per source
+        state_prefix = os.path.join(
+            config.SESSION_CACHE_DIR, re.sub(r"\W+", "_", source_name.lower())
+        )
+        self._cookies_path = f"{state_prefix}_cookies.json"
+        self._playwright_state_path = f"{state_prefix}_playwright_state.json"
+        self._load_cookies()
+        # Set from another thread to ask a running collect_cases to wind down;
+        # paginating scrapers check it between pages
+        self.stop_event = threading.Event()
+        # Resolved once here so callers don't introspect collect_cases per run
+        self.supports_max_pages = (
+            "max_pages" in inspect.signature(self.collect_cases).parameters
+        )
+
+    def _load_cookies(self):
+        """Restore session cookies saved by a previous run, if any"""
+        if not os.path.exists(self._cookies_path):
+            return
+        try:
+            with open(self._cookies_path, encoding="utf-8") as f:
+                for cookie in json.load(f):
+                    self.session.cookies.set(**cookie)
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Could not load saved cookies: {e}")
+
+    def _save_cookies(self):
+        """Save session cookies so the next run can skip consent/auth walls"""
+        cookies = [
+            {
+                "name": c.name,
+                "value": c.value,
+                "domain": c.domain,
+                "path": c.path,
+                "expires": c.expires,
+                "secure": c.secure,
+            }
+            for c in self.session.cookies
+        ]
+        if not cookies:
+            return
+        try:
+            _write_atomic(self._cookies_path, json.dumps(cookies))
+        except OSError as e:
+            logger.debug(f"Could not save cookies: {e}")
+
+    def _cached_page_path(self, url: str) -> str:
+        """Cache file for url, keyed by URL and day so it never outlives its date"""
+        key = f"{url}|{date.today().isoformat()}"
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(config.PAGE_CACHE_DIR, f"{digest}.html")
+
+    def _prune_page_cache(self):
+        """Delete cached pages older than PAGE_CACHE_TTL"""
+        cutoff = time.time() - config.PAGE_CACHE_TTL
+        try:
+            with os.scandir(config.PAGE_CACHE_DIR) as entries:
+                for entry in entries:
+                    # .tmp covers writes cut off before _write_atomic could clean up
+                    if (
+                        entry.name.endswith((".html", ".tmp"))
+                        and entry.stat().st_mtime < cutoff
+                    ):
+                        os.remove(entry.path)
+        except OSError as e:
+            logger.debug(f"Could not prune page cache: {e}")
+
+    def _load_cached_page(self, url: str) -> Optional[str]:
+        """Return rendered HTML saved within PAGE_CACHE_TTL, skipping the browser"""
+        if config.PAGE_CACHE_TTL <= 0:
+            return None
+        path = self._cached_page_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > config.PAGE_CACHE_TTL:
+                return None
+            with open(path, encoding="utf-8") as f:
+                html_content = f.read()
+        except OSError:
+            return None
+        logger.info(f"Using cached HTML for {url}")
+        return html_content
+
+    def _save_cached_page(self, url: str, html_content: str):
+        """Save rendered HTML so repeat runs within PAGE_CACHE_TTL skip Playwright"""
+        if config.PAGE_CACHE_TTL <= 0:
+            return
+        self._prune_page_cache()
+        try:
+            # A partial file would be served as a complete page for the whole TTL
+            _write_atomic(self._cached_page_path(url), html_content)
+        except OSError as e:
+            logger.debug(f"Could not cache page {url}: {e}")
+
+    def _load_playwright_state(self) -> Optional[Dict]:
+        """Return browser storage saved by a previous run, dropping it if unreadable"""
+        if not os.path.exists(self._playwright_state_path):
+            return None
+        try:
+            with open(self._playwright_state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            if isinstance(state, dict):
+                return state
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not load saved Playwright state: {e}")
+        # A truncated or corrupt file would otherwise break every later run
+        try:
+            os.remove(self._playwright_state_path)
+        except OSError:
+            pass
+        return None
+
+    def close(self):
+        """Persist session state and release the browser"""
+        self._save_cookies()
+        if self.use_playwright:
+            self._close_playwright()
 
     def _init_playwright(self):
         """Initialize Playwright browser if not already initialized"""
@@ -43,8 +287,9 @@ class BaseScraper:
                 self.playwright_context = self.playwright_browser.new_context(
                     viewport={"width": 1920, "height": 1080},
                     user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+                    storage_state=self._load_playwright_state(),
                 )
-                # Don't create a page here - create one per request
+                # The page itself is created lazily by _get_playwright_page
                 logger.info("Playwright browser initialized")
             except ImportError:
                 logger.error(
@@ -53,17 +298,28 @@ class BaseScraper:
                 raise
             except Exception as e:
                 logger.error(f"Failed to initialize Playwright: {e}")
+                # Drop any half-started browser so the next fetch retries cleanly
+                self._close_playwright()
                 raise
 
     def _close_playwright(self):
         """Close Playwright browser"""
         try:
-            if hasattr(self, "playwright_context") and self.playwright_context:
+            if self.playwright_context:
+                try:
+                    # Keep cookies/local storage so the next run starts warm
+                    _write_atomic(
+                        self._playwright_state_path,
+                        json.dumps(self.playwright_context.storage_state()),
+                    )
+                except Exception as e:
+                    logger.debug(f"Could not save Playwright storage state: {e}")
                 self.playwright_context.close()
             if self.playwright_browser:
                 self.playwright_browser.close()
-            if hasattr(self, "playwright") and self.playwright:
+            if self.playwright:
                 self.playwright.stop()
+            self.playwright = None
             self.playwright_browser = None
             self.playwright_page = None
             self.playwright_context = None
@@ -71,27 +327,64 @@ class BaseScraper:
         except Exception as e:
             logger.warning(f"Error closing Playwright: {e}")
 
+    def _get_playwright_page(self):
+        """Return the reusable Playwright page, opening a new one if needed"""
+        if self.playwright_page is None or self.playwright_page.is_closed():
+            self.playwright_page = self.playwright_context.new_page()
+        return self.playwright_page
+
+    def _discard_playwright_page(self):
+        """Close the reusable page so the next fetch starts from a fresh one"""
+        page, self.playwright_page = self.playwright_page, None
+        if page:
+            try:
+                page.close()
+            except Exception as e:
+                logger.debug(f"Error closing page: {e}")
+
     def fetch_page(
         self,
         url: str,
         retries: int = config.MAX_RETRIES,
         wait_for: Optional[str] = None,
+        cache: bool = False,
     ) -> Optional[requests.Response]:
-        """Fetch a page with retry logic"""
+        """Fetch a page with retry logic
+
+        With cache=True, a Playwright render of url from today is reused for up
+        to config.PAGE_CACHE_TTL seconds. Only pass it for pages whose content
+        is stable over that window, not for search results.
+        """
+        host = urlparse(url).netloc
         if self.use_playwright:
-            return self._fetch_with_playwright(url, wait_for)
+            if cache:
+                cached = self._load_cached_page(url)
+                if cached is not None:
+                    return MockResponse(text=cached, url=url)
+            _rate_limiter.acquire(host)
+            response = self._fetch_with_playwright(url, wait_for)
+            # Never replay error or rate-limit pages from the cache
+            if cache and response is not None and response.status_code < 400:
+                self._save_cached_page(url, response.text)
+            return response
 
         # Fallback to requests
         for attempt in range(retries):
             try:
-                time.sleep(config.REQUEST_DELAY)
+                _rate_limiter.acquire(host)
                 response = self.session.get(url, timeout=config.TIMEOUT)
                 response.raise_for_status()
                 return response
             except requests.RequestException as e:
                 logger.warning(f"Attempt {attempt + 1}/{retries} failed for {url}: {e}")
                 if attempt < retries - 1:
-                    time.sleep(2**attempt)  # Exponential backoff
+                    response = e.response
+                    retry_after = (
+                        response.headers.get("Retry-After")
+                        if response is not None
+                        else None
+                    )
+                    time.sleep(_retry_delay(attempt, retry_after))
                 else:
                     logger.error(f"Failed to fetch {url} after {retries} attempts")
                     return None
@@ -99,17 +392,16 @@ class BaseScraper:
 
     def _fetch_with_playwright(
         self, url: str, wait_for: Optional[str] = None
-    ) -> Optional[requests.Response]:
+    ) -> Optional[MockResponse]:
         """Fetch page using Playwright to render JavaScript"""
-        page = None
         try:
             self._init_playwright()
 
-            # Create a new page for each request to avoid async conflicts
-            page = self.playwright_context.new_page()
+            # Reuse one page across requests instead of paying page setup per URL
+            page = self._get_playwright_page()
             logger.info(f"Loading {url} with Playwright...")
 
-            page.goto(url, wait_until="networkidle", timeout=60000)
+            goto_response = page.goto(url, wait_until="networkidle", timeout=60000)
 
             # Wait for specific selector if provided
             if wait_for:
@@ -126,32 +418,23 @@ class BaseScraper:
             # Get the rendered HTML
             html_content = page.content()
 
-            # Create a mock response object
-            class MockResponse:
-                def __init__(self, text):
-                    self.text = text
-                    self.status_code = 200
-                    self.url = url
-
-                def raise_for_status(self):
-                    pass
-
-            return MockResponse(html_content)
+            return MockResponse(
+                text=html_content,
+                url=url,
+                status_code=goto_response.status if goto_response else 200,
+            )
 
         except Exception as e:
             logger.error(f"Error fetching {url} with Playwright: {e}")
+            # The page may be mid-navigation or crashed; don't reuse it
+            self._discard_playwright_page()
             return None
-        finally:
-            # Always close the page after use
-            if page:
-                try:
-                    page.close()
-                except Exception as e:
-                    logger.debug(f"Error closing page: {e}")
 
-    def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse HTML content"""
-        return BeautifulSoup(html_content, "lxml")
+    def parse_html(
+        self, html_content: str, strainer: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        """Parse HTML content, keeping only what strainer matches if given"""
+        return BeautifulSoup(html_content, "lxml", parse_only=strainer)
 
     def extract_cases(self, soup: BeautifulSoup) -> List[Dict]:
         """Extract case information from parsed HTML - to be implemented by subclasses"""
@@ -179,8 +462,8 @@ class BaseScraper:
         case_date = case["decision_date"]
         if isinstance(case_date, str):
             try:
-                case_date = datetime.strptime(case_date, "%Y-%m-%d").date()
-            except:
+                case_date = _parse_ymd_date(case_date)
+            except ValueError:
                 # If we can't parse the date, include the case
                 logger.debug(f"Could not parse date {case_date}, including case")
                 return True
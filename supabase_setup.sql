@@ -31,6 +31,11 @@ CREATE INDEX IF NOT EXISTS idx_court_type ON court_cases(court_type);
 CREATE INDEX IF NOT EXISTS idx_docket_number ON court_cases(docket_number);
 CREATE INDEX IF NOT EXISTS idx_case_name ON court_cases(case_name);
 
+-- One row per docket/decision date; lets bulk saves skip existing cases via upsert.
+-- On an existing table, remove duplicate rows first (see SUPABASE_SETUP.md)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_docket_decision_unique
+    ON court_cases(docket_number, decision_date);
+
 -- Create collection_progress table
 CREATE TABLE IF NOT EXISTS collection_progress (
     id BIGSERIAL PRIMARY KEY,